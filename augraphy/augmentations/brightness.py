@@ -5,6 +5,7 @@ from typing import Union
 import cv2
 import numpy as np
 
+from augraphy.augmentations.lib import scale_intensity
 from augraphy.base.augmentation import Augmentation
 
 
@@ -40,14 +41,15 @@ class Brightness(Augmentation):
     # Applies the Augmentation to input data.
     def __call__(self, image: np.ndarray, force: bool = False) -> np.ndarray:
         if force or self.should_run():
-            image = image.copy()
             value = random.uniform(self.brightness_range[0], self.brightness_range[1])
-            if len(image.shape) < 3:
-                image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
-            hsv = cv2.cvtColor(image.astype("uint8"), cv2.COLOR_BGR2HSV)
 
-            hsv = np.array(hsv, dtype=np.float64)
-            hsv[:, :, 2] = hsv[:, :, 2] * value
+            # intensity is the HSV value channel, max of the BGR channels
+            image = image.astype(np.float32)
+            if len(image.shape) < 3:
+                intensity = image
+            else:
+                intensity = image.max(axis=2)
+            new_intensity = intensity * value
 
             # increase intensity value for area with intensity below min brightness value
             if self.min_brightness:
@@ -58,11 +60,12 @@ class Brightness(Augmentation):
                 counting_step = 10
                 counting_value = counting_step
                 while counting_value < min_brightness_value:
-                    hsv[:, :, 2][hsv[:, :, 2] < counting_value] += counting_step
+                    new_intensity[new_intensity < counting_value] += counting_step
                     counting_value += counting_step
 
-            hsv[:, :, 2][hsv[:, :, 2] > 255] = 255
-            hsv = np.array(hsv, dtype=np.uint8)
-            image = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
+            # scale BGR directly instead of a round trip through HSV
+            image = scale_intensity(image, intensity, new_intensity)
+            if len(image.shape) < 3:
+                image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
 
             return image
@@ -33,37 +33,31 @@ class BrightnessTexturize(Augmentation):
     def compute_texture(self, hsv: np.ndarray) -> np.ndarray:
         # compute random value
         value = random.uniform(self.low, self.high)
-        # convert to float (range 0-1)
-        hsv = np.array(hsv, dtype=np.float64)
+        # convert to float
+        hsv = np.array(hsv, dtype=np.float32)
 
         # add noise using deviation
         low_value = value - (value * self.deviation)  # *random.uniform(0, deviation)
         max_value = value + (value * self.deviation)
 
         # apply noise
-        makerand = np.vectorize(lambda x: random.uniform(low_value, max_value))
-        brightness_matrix = makerand(np.zeros((hsv.shape[0], hsv.shape[1])))
-        hsv[:, :, 1] *= brightness_matrix
-        hsv[:, :, 2] *= brightness_matrix
-        hsv[:, :, 1][hsv[:, :, 1] > 255] = 255
-        hsv[:, :, 2][hsv[:, :, 2] > 255] = 255
+        brightness_matrix = np.random.uniform(low_value, max_value, size=(hsv.shape[0], hsv.shape[1]))
+        hsv[:, :, 1:3] *= brightness_matrix[:, :, None]
+        np.minimum(hsv[:, :, 1:3], 255, out=hsv[:, :, 1:3])
 
         # convert back to uint8, apply bitwise not and convert to hsv again
         hsv = np.array(hsv, dtype=np.uint8)
         hsv = np.invert(hsv)
-        hsv = np.array(hsv, dtype=np.float64)
+        hsv = np.array(hsv, dtype=np.float32)
 
         # add noise using deviation again
         new_low_value = value - (value * self.deviation)
         new_max_value = value + (value * self.deviation)
 
         # apply noise again
-        makerand = np.vectorize(lambda x: random.uniform(new_low_value, new_max_value))
-        brightness_matrix = makerand(np.zeros((hsv.shape[0], hsv.shape[1])))
-        hsv[:, :, 1] *= brightness_matrix
-        hsv[:, :, 2] *= brightness_matrix
-        hsv[:, :, 1][hsv[:, :, 1] > 255] = 255
-        hsv[:, :, 2][hsv[:, :, 2] > 255] = 255
+        brightness_matrix = np.random.uniform(new_low_value, new_max_value, size=(hsv.shape[0], hsv.shape[1]))
+        hsv[:, :, 1:3] *= brightness_matrix[:, :, None]
+        np.minimum(hsv[:, :, 1:3], 255, out=hsv[:, :, 1:3])
 
         # convert back to uint8, apply bitwise not
         hsv = np.array(hsv, dtype=np.uint8)
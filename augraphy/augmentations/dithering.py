@@ -1,10 +1,115 @@
-from typing import List
-from typing import Tuple
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import cv2
 import numpy as np
+from numba import njit
 
 from augraphy.base.augmentation import Augmentation
 
+# shared pool to dither colour channels in parallel, the numba kernel releases the GIL
+_channel_executor = None
+_channel_executor_lock = threading.Lock()
+
+
+def _get_channel_executor() -> ThreadPoolExecutor:
+    """Returns the shared channel pool, creating it on first use."""
+    global _channel_executor
+    with _channel_executor_lock:
+        if _channel_executor is None:
+            _channel_executor = ThreadPoolExecutor(max_workers=3)
+        return _channel_executor
+
+
+def _reset_channel_executor():
+    """Drops the pool inherited by a forked child, its worker threads don't exist there."""
+    global _channel_executor, _channel_executor_lock
+    _channel_executor = None
+    _channel_executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_channel_executor)
+
+
+@njit(cache=True, nogil=True)
+def _fs_numba(image: np.ndarray) -> np.ndarray:
+    """Run Floyd Steinberg dithering algorithm on a 2D uint8 image.
+    Quantization error is carried in two rolling int16 rows and distributed
+    with 7/16, 3/16, 5/16 and 1/16 weights using rounded shifts.
+
+    :param image: The single channel image to apply the function.
+    """
+
+    ysize, xsize = image.shape
+    image_dither = image.copy()
+    err_curr = np.zeros(xsize, dtype=np.int16)
+    err_next = np.zeros(xsize, dtype=np.int16)
+    for y in range(1, ysize):
+        if y < ysize - 1:
+            for x in range(1, xsize - 1):
+                old_pixel = np.int32(image[y, x]) + err_curr[x]
+                new_pixel = 255 if old_pixel >= 128 else 0
+                image_dither[y, x] = new_pixel
+                # only the negative error is diffused, shifts are rounded to nearest
+                quant_error = max(new_pixel - old_pixel, 0)
+                err_curr[x + 1] -= (quant_error * 7 + 8) >> 4
+                err_next[x - 1] -= (quant_error * 3 + 8) >> 4
+                err_next[x] -= (quant_error * 5 + 8) >> 4
+                err_next[x + 1] -= (quant_error + 8) >> 4
+            # first and last column only receive the diffused error
+            for x in (0, xsize - 1):
+                image_dither[y, x] = min(max(np.int32(image[y, x]) + err_curr[x], 0), 255)
+        else:
+            # last row only receives the diffused error
+            for x in range(xsize):
+                image_dither[y, x] = min(max(np.int32(image[y, x]) + err_curr[x], 0), 255)
+        # move to next row
+        err_curr, err_next = err_next, err_curr
+        err_next[:] = 0
+    return image_dither
+
+
+# Adapted from https://github.com/tromero/BayerMatrix
+def _create_bayer(x: int, y: int, size: int, value: int, step: int, matrix: np.ndarray):
+    """Function to fill ordered matrix recursively.
+
+    :param x: The x coordinate of current step.
+    :param y: The y coordinate of current step.
+    :param size: Size of current quadrant.
+    :param value: Value of current step.
+    :param step: Current step value.
+    :param matrix: The ordered matrix for ordered dithering algorithm.
+    """
+    if size == 1:
+        matrix[y, x] = value
+        return
+    half = size // 2
+    # subdivide into quad tree and call recursively
+    # pattern is TL, BR, TR, BL
+    _create_bayer(x, y, half, value + (step * 0), step * 4, matrix)
+    _create_bayer(x + half, y + half, half, value + (step * 1), step * 4, matrix)
+    _create_bayer(x + half, y, half, value + (step * 2), step * 4, matrix)
+    _create_bayer(x, y + half, half, value + (step * 3), step * 4, matrix)
+
+
+@lru_cache(maxsize=8)
+def _make_bayer(order: int) -> np.ndarray:
+    """Create the bayer matrix of size 2**order, quantitized to 0-255.
+    The result is cached and returned read-only.
+
+    :param order: Order number of the ordered dithering.
+    """
+    size = 2**order
+    matrix = np.zeros((size, size), dtype=np.int64)
+    _create_bayer(0, 0, size, 0, 1, matrix)
+    # quantitize order matrix value
+    bayer = np.floor((matrix / (size * size - 1)) * 255).astype(np.uint8)
+    bayer.setflags(write=False)
+    return bayer
+
 
 class Dithering(Augmentation):
     """
@@ -24,54 +129,56 @@ class Dithering(Augmentation):
         super().__init__(p=p)
         self.dither = dither
         self.order = order
+        # (key, tiled threshold) of the latest image shape, reused by same shape images
+        self._tiled_cache = (None, None)
 
     # Constructs a string representation of this Augmentation.
     def __repr__(self):
         return f"Dithering(dither={self.dither}, p={self.p})"
 
-    def apply_Floyd_Steinberg(self, image: np.ndarray, ysize: int, xsize: int) -> np.ndarray:
-        """Run Floyd Steinberg dithering algorithm to the input image.
-
-        :param image: The image to apply the function.
-        :param ysize: Height of image.
-        :param xsize: Width of image.
-        """
-
-        for y in range(1, ysize - 1):
-            for x in range(1, xsize - 1):
-                old_pixel = image[y, x]
-                new_pixel = 255 * np.floor(old_pixel / 128)
-                image[y, x] = new_pixel
-                quant_error = min(old_pixel - new_pixel, 0)  # remove negative
-                image[y, x + 1] += quant_error * (7 / 16)
-                image[y + 1, x - 1] += quant_error * (3 / 16)
-                image[y + 1, x] += quant_error * (5 / 16)
-                image[y + 1, x + 1] += quant_error * (1 / 16)
-        return image.astype("uint8")
-
     def dither_Floyd_Steinberg(self, image: np.ndarray) -> np.ndarray:
         """Apply Floyd Steinberg dithering to the input image.
 
         :param image: The image to apply the function.
         """
 
+        image = image.astype(np.uint8, copy=False)
         if len(image.shape) > 2:  # coloured image
-            ysize, xsize, dim = image.shape
-            img_dither_fs = image.copy().astype("float")
-            for channel_num in range(dim):
-                img_dither_fs[:, :, channel_num] = self.apply_Floyd_Steinberg(
-                    img_dither_fs[:, :, channel_num],
-                    ysize,
-                    xsize,
-                )
+            img_dither_fs = np.empty_like(image)
+            channels = [image[:, :, channel_num] for channel_num in range(image.shape[2])]
+            for channel_num, channel_dither in enumerate(_get_channel_executor().map(_fs_numba, channels)):
+                img_dither_fs[:, :, channel_num] = channel_dither
         else:  # grayscale or binary
-            ysize, xsize = image.shape
-            img_dither_fs = image.copy().astype("float")
-            img_dither_fs = self.apply_Floyd_Steinberg(img_dither_fs, ysize, xsize)
+            img_dither_fs = _fs_numba(image)
+
+        return img_dither_fs
 
-        return img_dither_fs.astype("uint8")
+    def tile_Ordered(self, image: np.ndarray, ysize: int, xsize: int, order: int, ordered_matrix: np.ndarray):
+        """Tile the ordered matrix threshold over the whole image.
 
-    def apply_Ordered(self, image: np.ndarray, ysize: int, xsize: int, order: int, ordered_matrix: List[List[int]]):
+        :param image: The image to apply the function.
+        :param ysize: Height of image.
+        :param xsize: Width of image.
+        :param order: Order number of ordered dithering.
+        :param ordered_matrix: Ordered matrix for ordered dithering algorithm.
+        """
+
+        # tile the order x order threshold block over the whole image
+        threshold = ordered_matrix[:order, :order]
+        tiled = np.tile(threshold, (int(np.ceil(ysize / order)), int(np.ceil(xsize / order))))[:ysize, :xsize]
+        if len(image.shape) > 2:  # same threshold for every channel
+            tiled = cv2.merge([tiled] * image.shape[2])
+        return tiled
+
+    def apply_Ordered(
+        self,
+        image: np.ndarray,
+        ysize: int,
+        xsize: int,
+        order: int,
+        ordered_matrix: np.ndarray,
+        tiled: np.ndarray = None,
+    ):
         """Run ordered dithering algorithm to the input image.
 
         :param image: The image to apply the function.
@@ -79,17 +186,17 @@ class Dithering(Augmentation):
         :param xsize: Width of image.
         :param order: Order number of ordered dithering.
         :param ordered_matrix: Ordered matrix for ordered dithering algorithm.
+        :param tiled: Threshold already tiled from ordered_matrix, built when not provided.
         """
 
-        for y in range(ysize):
-            for x in range(xsize):
-                oy = y % order
-                ox = x % order
-                if image[y, x] > ordered_matrix[oy][ox]:
-                    image[y, x] = 255
-                else:
-                    image[y, x] = 0
-        return image.astype("uint8")
+        if tiled is None:
+            tiled = self.tile_Ordered(image, ysize, xsize, order, ordered_matrix)
+
+        # 255 where pixel is above threshold, else 0
+        image_dither = cv2.compare(image.astype("uint8", copy=False), tiled, cv2.CMP_GT)
+
+        # cv2 drops the channel axis of single channel images
+        return image_dither.reshape(image.shape)
 
     def dither_Ordered(self, image: np.ndarray, order: int = 5) -> np.ndarray:
         """Apply ordered dithering to the input image.
@@ -97,77 +204,22 @@ class Dithering(Augmentation):
         :param image: The image to apply the function.
         :param order: Order number of the ordered dithering.
         """
-        # create bayer matrix based on the order
-        ordered_matrix = self.create_bayer(0, 0, 2 ** (order), 0, 1)
-        total_number = len(ordered_matrix) * len(ordered_matrix[0]) - 1
-        # quantitize order matrix value
-        for y, row in enumerate(ordered_matrix):
-            for x, value in enumerate(row):
-                ordered_matrix[y][x] = np.floor((value / total_number) * 255)
+        # get quantitized bayer matrix based on the order
+        ordered_matrix = _make_bayer(order)
 
-        if len(image.shape) > 2:  # coloured image
-            ysize, xsize, dim = image.shape
-            img_dither_ordered = image.copy().astype("float")
-            for channel_num in range(dim):
-                img_dither_ordered[:, :, channel_num] = self.apply_Ordered(
-                    img_dither_ordered[:, :, channel_num],
-                    ysize,
-                    xsize,
-                    order,
-                    ordered_matrix,
-                )
-        else:  # grayscale or binary
-            ysize, xsize = image.shape
-            img_dither_ordered = image.copy().astype("float")
-            img_dither_ordered = self.apply_Ordered(
-                img_dither_ordered,
-                ysize,
-                xsize,
-                order,
-                ordered_matrix,
-            )
-
-        return img_dither_ordered.astype("uint8")
-
-    # Adapted from https://github.com/tromero/BayerMatrix
-    def create_bayer(
-        self,
-        x: int,
-        y: int,
-        size: int,
-        value: int,
-        step: int,
-        matrix: List[List[int]] = [[]],
-    ) -> List[List[int]]:
-        """Function to create ordered matrix.
-
-        :param x: The x coordinate of current step.
-        :param y: The y coordinate of current step.
-        :param size: Size of ordered matrix.
-        :param value: Value of current step.
-        :param step: Current step value.
-        :param _matrix: The ordered matrix for ordered dithering algorithm.
-        """
-        if matrix == [[]]:
-            matrix = [[0 for i in range(size)] for i in range(size)]
-        if size == 1:
-            matrix[int(y)][int(x)] = value
-            return
-        half = size / 2
-        # subdivide into quad tree and call recursively
-        # pattern is TL, BR, TR, BL
-        self.create_bayer(x, y, half, value + (step * 0), step * 4, matrix)
-        self.create_bayer(
-            x + half,
-            y + half,
-            half,
-            value + (step * 1),
-            step * 4,
-            matrix,
-        )
-        self.create_bayer(x + half, y, half, value + (step * 2), step * 4, matrix)
-        self.create_bayer(x, y + half, half, value + (step * 3), step * 4, matrix)
-        return matrix
+        ysize, xsize = image.shape[:2]
+
+        # the matrix only depends on order, so order and shape identify the tiled threshold.
+        # read key and tile together, so other threads can't pair them up wrongly
+        tiled_key = (order, image.shape)
+        cached_key, tiled = self._tiled_cache
+        if tiled_key != cached_key:
+            tiled = self.tile_Ordered(image, ysize, xsize, order, ordered_matrix)
+            self._tiled_cache = (tiled_key, tiled)
+
+        img_dither_ordered = self.apply_Ordered(image, ysize, xsize, order, ordered_matrix, tiled)
+
+        return img_dither_ordered
 
     # Applies the Augmentation to input data.
     def __call__(self, image: np.ndarray, force: bool = False) -> np.ndarray:
@@ -1,10 +1,8 @@
-import random
 from typing import Tuple
 
 import cv2
 import numpy as np
 
-from augraphy.augmentations.lib import rotate_image
 from augraphy.base.augmentation import Augmentation
 
 
@@ -44,7 +42,7 @@ class Geometric(Augmentation):
     def __repr__(self):
         return f"Geometry(scale={self.scale}, translation={self.translation}, fliplr={self.fliplr}, flipud={self.flipud}, crop={self.crop}, rotate_range={self.rotate_range}, p={self.p})"
 
-    def crop(self, image: np.ndarray) -> np.ndarray:
+    def _apply_crop(self, image: np.ndarray) -> np.ndarray:
         # crop image
         # make sure there's only 4 inputs, x0, y0, xn, yn
         if len(self.crop) == 4:
@@ -64,71 +62,95 @@ class Geometric(Augmentation):
         return image
 
     def scale_resize(self, image: np.ndarray) -> np.ndarray:
-        scale = random.uniform(self.scale[0], self.scale[1])
+        scale = np.random.uniform(self.scale[0], self.scale[1])
         if scale > 0:
             new_width = int(image.shape[1] * scale)
             new_height = int(image.shape[0] * scale)
             new_size = (new_width, new_height)
-            image = cv2.resize(image, new_size, interpolation=cv2.INTER_AREA)
+            # skip resizing when size is unchanged
+            if (new_height, new_width) != image.shape[:2]:
+                image = cv2.resize(image, new_size, interpolation=cv2.INTER_AREA)
 
         return image
 
-    def translate(self, image: np.ndarray) -> np.ndarray:
-        image_new = np.full_like(image, fill_value=255).astype("uint8")
-        offset_x = self.translation[0]
-        offset_y = self.translation[1]
-
-        # x translation
-        if offset_x > 0:
-            image_new[:, offset_x:] = image[:, :-offset_x]
-            image = image_new
-        elif offset_x < 0:
-            image_new[:, :offset_x] = image[:, abs(offset_x) :]
-            image = image_new
-
-        new_image_new = np.full_like(image, fill_value=255).astype("uint8")
-
-        # y translation
-        if offset_y > 0:
-            new_image_new[offset_y:, :] = image[:-offset_y, :]
-            image = new_image_new
-        elif offset_y < 0:
-            new_image_new[:offset_y, :] = image[abs(offset_y) :, :]
-            image = new_image_new
-
-        return image
+    def affine_transform(self, image: np.ndarray, angle: int) -> np.ndarray:
+        """Applies translation, flips and rotation with a single warp.
+
+        :param image: The image to apply the function.
+        :param angle: Rotation angle in degrees, the image is expanded to avoid cropping.
+        """
+        ysize, xsize = image.shape[:2]
+        offset_x, offset_y = self.translation
+
+        # translation, pixels moved outside of the image are discarded
+        ystart, yend = max(0, -offset_y), max(0, ysize - offset_y)
+        xstart, xend = max(0, -offset_x), max(0, xsize - offset_x)
+        image = image[ystart:yend, xstart:xend]
+        matrix = np.array(
+            [[1, 0, max(0, offset_x)], [0, 1, max(0, offset_y)], [0, 0, 1]],
+            dtype="float",
+        )
+
+        # flip left right
+        if self.fliplr:
+            matrix = np.array([[-1, 0, xsize - 1], [0, 1, 0], [0, 0, 1]]) @ matrix
+
+        # flip up down
+        if self.flipud:
+            matrix = np.array([[1, 0, 0], [0, -1, ysize - 1], [0, 0, 1]]) @ matrix
+
+        # rotation, expanding output size to fit the rotated image
+        if angle != 0:
+            image_center = (xsize / 2, ysize / 2)
+            rotation_matrix = np.vstack((cv2.getRotationMatrix2D(image_center, angle, 1.0), [0, 0, 1]))
+            abs_cos = abs(rotation_matrix[0, 0])
+            abs_sin = abs(rotation_matrix[0, 1])
+            bound_w = int(ysize * abs_sin + xsize * abs_cos)
+            bound_h = int(ysize * abs_cos + xsize * abs_sin)
+            rotation_matrix[0, 2] += bound_w / 2 - image_center[0]
+            rotation_matrix[1, 2] += bound_h / 2 - image_center[1]
+            matrix = rotation_matrix @ matrix
+            xsize, ysize = bound_w, bound_h
+
+        # without rotation every pixel moves by whole pixels, so no interpolation is needed
+        interpolation = cv2.INTER_LINEAR if angle != 0 else cv2.INTER_NEAREST
+
+        # uncovered area is filled with white
+        if image.size == 0:
+            return np.full((ysize, xsize) + image.shape[2:], fill_value=255, dtype=image.dtype)
+        return cv2.warpAffine(
+            image,
+            matrix[:2],
+            (xsize, ysize),
+            flags=interpolation,
+            borderMode=cv2.BORDER_CONSTANT,
+            borderValue=(255, 255, 255, 255),
+        )
 
     # Applies the Augmentation to input data.
     def __call__(self, image: np.ndarray, force: bool = False) -> np.ndarray:
         if force or self.should_run():
-            image = image.copy()
+            input_image = image
 
             if self.crop:
-                image = self.crop(image)
+                image = self._apply_crop(image)
 
             # resize based on scale
             if self.scale[1] > 0 and self.scale[0] > 0:
                 image = self.scale_resize(image)
 
-            # translate image based on translation value
-            if self.translation[0] != 0 or self.translation[1] != 0:
-                image = self.translate(image)
-
-            # flip left right
-            if self.fliplr:
-                image = np.fliplr(image)
-
-            # flip up down
-            if self.flipud:
-                image = np.flipud(image)
-
             # generate random angle
             if (self.rotate_range[0] != 0) | (self.rotate_range[1] != 0):
-                angle = random.randint(self.rotate_range[0], self.rotate_range[1])
+                angle = np.random.randint(self.rotate_range[0], self.rotate_range[1] + 1)
             else:
                 angle = 0
-            # rotate image
-            if angle != 0:
-                image = rotate_image(image, angle)
+
+            # translate, flip and rotate image in a single pass
+            if self.translation[0] != 0 or self.translation[1] != 0 or self.fliplr or self.flipud or angle != 0:
+                image = self.affine_transform(image, angle)
+
+            # resize and warp return new buffers, copy only when the result is still the input or a crop of it
+            if np.may_share_memory(image, input_image):
+                image = image.copy()
 
             return image
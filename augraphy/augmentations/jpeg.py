@@ -1,4 +1,3 @@
-import random
 from typing import Tuple
 
 import cv2
@@ -31,11 +30,11 @@ class Jpeg(Augmentation):
     # Applies the Augmentation to input data.
     def __call__(self, image: np.ndarray, force: bool = False) -> np.ndarray:
         if force or self.should_run():
-            image = image.copy()
-            encode_param = [
-                int(cv2.IMWRITE_JPEG_QUALITY),
-                random.randint(self.quality_range[0], self.quality_range[1]),
-            ]
+            encode_param = (
+                cv2.IMWRITE_JPEG_QUALITY,
+                np.random.randint(self.quality_range[0], self.quality_range[1] + 1),
+            )
+            # imencode doesn't modify the input, so no copy is needed
             result, encimg = cv2.imencode(".jpg", image, encode_param)
-            image = cv2.imdecode(encimg, 1)
+            image = cv2.imdecode(encimg, cv2.IMREAD_COLOR)
             return image
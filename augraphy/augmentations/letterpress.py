@@ -1,9 +1,7 @@
-import random
 from typing import Tuple
 
 import cv2
 import numpy as np
-from sklearn.datasets import make_blobs
 
 from augraphy.base.augmentation import Augmentation
 
@@ -50,55 +48,49 @@ class Letterpress(Augmentation):
             ysize, xsize = image.shape[:2]
             max_box_size = max(ysize, xsize)
 
-            noise_mask = np.copy(image)
+            # draw the cluster layout of all iterations up front
+            n_iterations = np.random.randint(8, 13)
+            n_clusters = np.random.randint(self.n_clusters[0], self.n_clusters[1] + 1, size=n_iterations)
+            n_samples = np.random.randint(self.n_samples[0], self.n_samples[1] + 1, size=n_clusters.sum())
+            stds = np.random.randint(self.std_range[0], self.std_range[1] + 1, size=n_iterations) / 100
 
-            generated_points = np.array([[-1, -1]], dtype="float")
-
-            for i in range(random.randint(8, 12)):
-
-                n_samples = [
-                    random.randint(self.n_samples[0], self.n_samples[1])
-                    for _ in range(random.randint(self.n_clusters[0], self.n_clusters[1]))
-                ]
-                std = random.randint(self.std_range[0], self.std_range[1]) / 100
-
-                # generate clusters of blobs
-                generated_points_new, point_group = make_blobs(
-                    n_samples=n_samples,
-                    center_box=(0, max_box_size),
-                    cluster_std=std,
-                    n_features=2,
-                )
-
-                generated_points = np.concatenate((generated_points, generated_points_new), axis=0)
+            # generate clusters of blobs, each point is its cluster center plus gaussian noise
+            centers = np.random.uniform(0, max_box_size, size=(n_clusters.sum(), 2))
+            point_stds = np.repeat(np.repeat(stds, n_clusters), n_samples)
+            generated_points = np.repeat(centers, n_samples, axis=0)
+            generated_points += np.random.normal(0, point_stds[:, None], size=generated_points.shape)
 
             # remove decimals
             generated_points = generated_points.astype("int")
 
-            # delete invalid points (smaller or bigger than image size)
-            ind_delete = np.where(generated_points[:, 0] < 0)
-            generated_points = np.delete(generated_points, ind_delete, axis=0)
-            ind_delete = np.where(generated_points[:, 1] < 0)
-            generated_points = np.delete(generated_points, ind_delete, axis=0)
-            ind_delete = np.where(generated_points[:, 0] > ysize - 1)
-            generated_points = np.delete(generated_points, ind_delete, axis=0)
-            ind_delete = np.where(generated_points[:, 1] > xsize - 1)
-            generated_points = np.delete(generated_points, ind_delete, axis=0)
+            # keep only valid points (within image size)
+            valid = (
+                (generated_points[:, 0] >= 0)
+                & (generated_points[:, 1] >= 0)
+                & (generated_points[:, 0] < ysize)
+                & (generated_points[:, 1] < xsize)
+            )
+            generated_points = generated_points[valid]
 
             # initialize mask and insert value
             noise_mask = np.zeros_like(image, dtype="uint8")
-            for i in range(generated_points.shape[0]):
-                noise_mask[generated_points[i][0], generated_points[i][1]] = random.randint(
-                    self.value_range[0],
-                    self.value_range[1],
-                )
+            values = np.random.randint(
+                self.value_range[0],
+                self.value_range[1] + 1,
+                size=generated_points.shape[0],
+                dtype=np.uint8,
+            )
+            # same value for every channel of a point
+            if len(image.shape) > 2:
+                values = values[:, None]
+            noise_mask[generated_points[:, 0], generated_points[:, 1]] = values
 
             if self.blur:
                 # gaussian blur needs uint8 input
                 noise_mask = cv2.GaussianBlur(noise_mask, (5, 5), 0)
 
             if self.value_threshold_range[1] >= self.value_threshold_range[0]:
-                value_threshold = random.randint(self.value_threshold_range[0], self.value_threshold_range[1])
+                value_threshold = np.random.randint(self.value_threshold_range[0], self.value_threshold_range[1] + 1)
             else:
                 value_threshold = self.value_threshold_range[1]
 
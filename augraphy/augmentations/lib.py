@@ -63,6 +63,29 @@ def generate_average_intensity(image: np.ndarray) -> Union[np.ndarray, float]:
         return np.average(image)
 
 
+def scale_intensity(image: np.ndarray, intensity: np.ndarray, new_intensity: np.ndarray) -> np.ndarray:
+    """Changes the intensity (HSV value channel) of a BGR or grayscale image
+    without converting to HSV. Every channel of a pixel is scaled by the same
+    ratio, which keeps its hue and saturation.
+
+    :param image: The image to apply the function.
+    :param intensity: Current intensity of image, the max of its channels.
+    :param new_intensity: New intensity of image, clipped to 255.
+    """
+
+    new_intensity = np.minimum(new_intensity, 255).astype(np.float32)
+    if len(image.shape) < 3:
+        return new_intensity.astype("uint8")
+
+    ratio = np.divide(new_intensity, intensity, out=np.zeros_like(new_intensity), where=intensity > 0)
+    image_scaled = image * ratio[:, :, None]
+    # black pixels have no hue, they become gray
+    black = intensity == 0
+    image_scaled[black] = new_intensity[black, None]
+
+    return image_scaled.astype("uint8")
+
+
 def add_folding_noise(img: np.ndarray, side: int, p: float = 0.1) -> np.ndarray:
     # Generate noise to edges of folding
     # side = flag to put more noise at certain side
@@ -3,8 +3,8 @@ from typing import Tuple
 
 import cv2
 import numpy as np
-from scipy.stats import norm
 
+from augraphy.augmentations.lib import scale_intensity
 from augraphy.base.augmentation import Augmentation
 
 
@@ -100,26 +100,24 @@ class LightingGradient(Augmentation):
         init_mask_ul = (int(padding), int(padding))
         init_mask_br = (int(padding + mask_size[0]), int(padding + mask_size[1]))
         init_light_pos = (padding + pos_x, padding + pos_y)
-        # fill in mask row by row with value decayed from center
-        for i in range(canvas_y):
-            if mode == "linear":
-                i_value = self._decayed_value_in_linear(
-                    i,
-                    max_brightness,
-                    init_light_pos[1],
-                    linear_decay_rate,
-                )
-            elif mode == "gaussian":
-                i_value = self._decayed_value_in_norm(
-                    i,
-                    max_brightness,
-                    min_brightness,
-                    init_light_pos[1],
-                    mask_size[1],
-                )
-            else:
-                i_value = 0
-            mask[i] = i_value
+        # fill in mask rows with value decayed from center
+        rows = np.arange(canvas_y)
+        if mode in ["linear_dynamic", "linear_static"]:
+            row_values = self._decayed_value_in_linear(
+                rows,
+                max_brightness,
+                init_light_pos[1],
+                linear_decay_rate,
+            )
+        else:
+            row_values = self._decayed_value_in_norm(
+                rows,
+                max_brightness,
+                min_brightness,
+                init_light_pos[1],
+                mask_size[1],
+            )
+        mask[:] = row_values[:, None]
         # rotate mask
         rotate_M = cv2.getRotationMatrix2D(init_light_pos, direction, 1)
         mask = cv2.warpAffine(mask, rotate_M, (canvas_x, canvas_y))
@@ -135,54 +133,43 @@ class LightingGradient(Augmentation):
 
         return mask
 
-    def _decayed_value_in_norm(self, x: int, max_value: int, min_value: int, center: int, grange: int):
+    def _decayed_value_in_norm(self, x: np.ndarray, max_value: int, min_value: int, center: int, grange: int):
         """Decay from max to min value following Gaussian distribution
 
-        :param x: Current x position.
+        :param x: Current x positions.
         :param max_value: Max of decayed value.
         :param min_value: Min of decayed value.
         :param center: Center of decayed value
         :param grange: Range of decay.
         """
         radius = grange / 3
-        center_prob = norm.pdf(center, center, radius)
-        x_prob = norm.pdf(x, center, radius)
-        x_value = (x_prob / center_prob) * (max_value - min_value) + min_value
+        # gaussian relative to its peak at center
+        x_prob = np.exp(-((x - center) ** 2) / (2 * radius**2))
+        x_value = x_prob * (max_value - min_value) + min_value
         return x_value
 
-    def _decayed_value_in_linear(self, x: int, max_value: int, padding_center: int, decay_rate: float):
+    def _decayed_value_in_linear(self, x: np.ndarray, max_value: int, padding_center: int, decay_rate: float):
         """Decay from max to min value with static linear decay rate.
 
-        :param x: Current x position.
+        :param x: Current x positions.
         :param max_value: Max of decayed value.
         :param padding_center: Center padding position.
         :param decay_rate: Rate of linear decay.
         """
 
-        x_value = max_value - abs(padding_center - x) * decay_rate
-        if x_value < 0:
-            x_value = 1
+        x_value = max_value - np.abs(padding_center - x) * decay_rate
+        x_value[x_value < 0] = 1
         return x_value
 
     # Applies the Augmentation to input data.
     def __call__(self, image: np.ndarray, force=False) -> np.ndarray:
         if force or self.should_run():
-            image = image.copy()
-
             if self.transparency is None:
                 transparency = random.uniform(0.5, 0.85)
             else:
                 transparency = self.transparency
 
-            frame = image
-
-            height, width = frame.shape[:2]
-            if len(frame.shape) > 2:
-                hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-            else:
-                bgr = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-                hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
-
+            height, width = image.shape[:2]
             mask = self.generate_parallel_light_mask(
                 mask_size=(width, height),
                 position=self.light_position,
@@ -192,8 +179,16 @@ class LightingGradient(Augmentation):
                 mode=self.mode,
                 linear_decay_rate=self.linear_decay_rate,
             )
-            hsv[:, :, 2] = hsv[:, :, 2] * transparency + mask * (1 - transparency)
-            frame = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
-            frame[frame > 255] = 255
-            frame = np.asarray(frame, dtype=np.uint8)
+
+            # blend mask into the intensity (HSV value channel) and scale BGR directly
+            image = image.astype(np.float32)
+            if len(image.shape) > 2:
+                intensity = image.max(axis=2)
+            else:
+                intensity = image
+            new_intensity = intensity * transparency + mask * (1 - transparency)
+            frame = scale_intensity(image, intensity, new_intensity)
+            if len(frame.shape) < 3:
+                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+
             return frame
@@ -1,5 +1,4 @@
-import random
-
+import cv2
 import numpy as np
 
 from augraphy.base.augmentation import Augmentation
@@ -30,37 +29,21 @@ class SubtleNoise(Augmentation):
 
         :param image: Image to apply the function.
         """
-        # get image size
-        ysize, xsize = image.shape[:2]
-
-        # generate 2d mask of random noise
+        # generate mask of random noise, one value per pixel and channel
         image_noise = np.random.randint(
             -self.subtle_range,
             self.subtle_range,
-            size=(ysize, xsize),
+            size=image.shape,
+            dtype=np.int16,
         )
 
-        # add noise to image
-        image = image.astype("int") + image_noise
+        # saturating add, result is clipped to 0-255 without upcasting image
+        image_output = cv2.add(image.astype("uint8", copy=False), image_noise, dtype=cv2.CV_8U)
 
-        return image
+        # cv2 drops the channel axis of single channel images
+        return image_output.reshape(image.shape)
 
     # Applies the Augmentation to input data.
     def __call__(self, image: np.ndarray, force: bool = False) -> np.ndarray:
         if force or self.should_run():
-            image = image.copy()
-
-            # multiple channels image
-            if len(image.shape) > 2:
-                # convert to int to enable negative
-                image = image.astype("int")
-                for i in range(image.shape[2]):
-                    image[:, :, i] = self.add_subtle_noise(image[:, :, i])
-            # single channel image
-            else:
-                image = self.add_subtle_noise(image)
-
-            # clip values between 0-255
-            image = np.clip(image, 0, 255)
-
-            return image.astype("uint8")
+            return self.add_subtle_noise(image)
@@ -73,6 +73,11 @@ class AugraphyPipeline:
             for i in range(len(self.save_paths)):
                 os.makedirs(self.save_paths[i], exist_ok=True)
 
+            # saving images needs the intermediate results of each sequence
+            for phase in [self.ink_phase, self.paper_phase, self.post_phase]:
+                if phase is not None:
+                    self.keep_sequence_results(phase)
+
     def wrapListMaybe(self, augs: Union[List, Augmentation]):
         """Converts a bare list to an AugmentationSequence, or does nothing."""
         if type(augs) is list:
@@ -80,6 +85,17 @@ class AugraphyPipeline:
         else:
             return augs
 
+    def keep_sequence_results(self, augmentation: Augmentation) -> None:
+        """Enables keep_intermediates in AugmentationSequence, including sequences nested in OneOf or AugmentationSequence.
+
+        :param augmentation: Augmentation object to check recursively.
+        """
+        if augmentation.__class__.__name__ == "AugmentationSequence":
+            augmentation.keep_intermediates = True
+        if augmentation.__class__.__name__ in ["AugmentationSequence", "OneOf"]:
+            for nested_augmentation in augmentation.augmentations:
+                self.keep_sequence_results(nested_augmentation)
+
     def augment(self, image: np.ndarray) -> dict:
         """Applies the Augmentations in each phase of the pipeline.
         Returns a dictionary of AugmentationResults representing the changes in each phase of the pipeline.
@@ -11,12 +11,15 @@ class AugmentationSequence(Augmentation):
 
     :param augmentations: A list of Augmentation objects to be applied.
     :param p: The probability that this Augmentation will be applied.
+    :param keep_intermediates: Flag to store the output of each augmentation
+           of the latest call in results.
     """
 
-    def __init__(self, augmentations: List[Augmentation], p: float = 1):
+    def __init__(self, augmentations: List[Augmentation], p: float = 1, keep_intermediates: bool = False):
         """Constructor method"""
         self.augmentations = augmentations
         self.p = p
+        self.keep_intermediates = keep_intermediates
         self.results = []
 
     def __repr__(self):
@@ -29,12 +32,14 @@ class AugmentationSequence(Augmentation):
 
     def __call__(self, image: np.ndarray, force: bool = False) -> Tuple[np.ndarray, List[Augmentation]]:
         if force or self.should_run():
+            self.results = []
             result = image
             for augmentation in self.augmentations:
                 if isinstance(result, tuple):
                     result = result[0]
                 current_result = augmentation(result)
-                self.results.append(current_result)
+                if self.keep_intermediates:
+                    self.results.append(current_result)
                 result = current_result
 
             return result, self.augmentations
@@ -361,9 +361,9 @@ class NoiseGenerator:
             n_step_x = int(xsize / random.randint(10, 14))
             n_step_y = int(ysize / random.randint(16, 20))
 
-            # initialize points array
-            generated_points_x = np.array([[-1]], dtype="int")
-            generated_points_y = np.array([[-1]], dtype="int")
+            # collect coordinates of each noise patch, combined once after the loop
+            points_x = [np.empty((0, 1), dtype="int")]
+            points_y = [np.empty((0, 1), dtype="int")]
 
             # initial noise location
             ccenter_y = (0, 0)
@@ -394,13 +394,8 @@ class NoiseGenerator:
                         ysize,
                     )
 
-                    # combine coordinates
-                    generated_points_x = np.concatenate(
-                        [generated_points_x, cgenerated_points_x],
-                    )
-                    generated_points_y = np.concatenate(
-                        [generated_points_y, cgenerated_points_y],
-                    )
+                    points_x.append(cgenerated_points_x)
+                    points_y.append(cgenerated_points_y)
 
                     # space between next noise patch
                     add_space = random.randint(10, 20)
@@ -422,6 +417,10 @@ class NoiseGenerator:
 
                 ccenter_y = [ccenter_y[1] + add_space, ccenter_y[1] + add_space]
 
+            # combine coordinates
+            generated_points_x = np.concatenate(points_x)
+            generated_points_y = np.concatenate(points_y)
+
             # generate mask
             img_mask = self.generate_mask(
                 noise_background,
@@ -28,9 +28,9 @@ setuptools.setup(
     packages=setuptools.find_packages(),
     python_requires=">=3.7",
     install_requires=[
+        "numba >= 0.53.0",
         "numpy >= 1.20.1",
         "opencv-python >= 4.5.1.48",
         "scikit-learn >= 0.0",
-        "scipy >= 1.6.3",
     ],
 )
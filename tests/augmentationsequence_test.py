@@ -0,0 +1,28 @@
+import random
+
+import numpy as np
+import pytest
+
+from augraphy import *
+
+
+@pytest.fixture
+def random_image():
+    xdim = random.randint(51, 500)
+    ydim = random.randint(51, 500)
+    return np.random.randint(low=0, high=255, size=(xdim, ydim, 3), dtype=np.uint8)
+
+
+def test_sequence_results_empty_by_default(random_image):
+    sequence = AugmentationSequence([SubtleNoise(p=1), Jpeg(p=1)])
+    sequence(random_image, force=True)
+    assert sequence.results == []
+
+
+def test_sequence_keep_intermediates(random_image):
+    augmentations = [SubtleNoise(p=1), Jpeg(p=1)]
+    sequence = AugmentationSequence(augmentations, keep_intermediates=True)
+    for _ in range(2):
+        result, _ = sequence(random_image, force=True)
+        assert len(sequence.results) == len(augmentations)
+    assert np.array_equal(sequence.results[-1], result)
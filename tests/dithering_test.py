@@ -0,0 +1,118 @@
+import multiprocessing
+import random
+
+import numpy as np
+import pytest
+
+from augraphy import *
+from augraphy.augmentations.dithering import _fs_numba
+
+
+@pytest.fixture
+def random_image():
+    xdim = random.randint(30, 80)
+    ydim = random.randint(30, 80)
+    return np.random.randint(low=0, high=255, size=(xdim, ydim, 3), dtype=np.uint8)
+
+
+def ordered_dither_loop(image, order):
+    """Reference per-pixel ordered dithering, as the loop implementation did it."""
+    size = 2**order
+    matrix = [[0 for _ in range(size)] for _ in range(size)]
+
+    def create_bayer(x, y, size, value, step):
+        if size == 1:
+            matrix[y][x] = value
+            return
+        half = size // 2
+        create_bayer(x, y, half, value + (step * 0), step * 4)
+        create_bayer(x + half, y + half, half, value + (step * 1), step * 4)
+        create_bayer(x + half, y, half, value + (step * 2), step * 4)
+        create_bayer(x, y + half, half, value + (step * 3), step * 4)
+
+    create_bayer(0, 0, size, 0, 1)
+    total_number = size * size - 1
+    matrix = [[np.floor((value / total_number) * 255) for value in row] for row in matrix]
+
+    output = image.astype("float")
+    channels = [output] if len(image.shape) < 3 else [output[:, :, i] for i in range(image.shape[2])]
+    for channel in channels:
+        for y in range(channel.shape[0]):
+            for x in range(channel.shape[1]):
+                channel[y, x] = 255 if channel[y, x] > matrix[y % order][x % order] else 0
+    return output.astype("uint8")
+
+
+@pytest.mark.parametrize("order", [2, 3, 5])
+def test_ordered_dithering_matches_loop(random_image, order):
+    dithering = Dithering(dither="ordered", order=order)
+    for image in [random_image, random_image[:, :, 0]]:
+        expected = ordered_dither_loop(image, order)
+        assert np.array_equal(dithering(image), expected)
+
+
+@pytest.mark.parametrize("dither", ["ordered", "floyd"])
+def test_single_channel_keeps_shape(random_image, dither):
+    image = random_image[:, :, :1]
+    assert Dithering(dither=dither)(image).shape == image.shape
+
+
+def floyd_steinberg_loop(image):
+    """Reference float Floyd Steinberg dithering with the kernel's threshold, only negative error is diffused."""
+    output = image.astype("float")
+    ysize, xsize = output.shape
+    for y in range(1, ysize - 1):
+        for x in range(1, xsize - 1):
+            old_pixel = output[y, x]
+            new_pixel = 255 if old_pixel >= 128 else 0
+            output[y, x] = new_pixel
+            quant_error = min(old_pixel - new_pixel, 0)
+            output[y, x + 1] += quant_error * (7 / 16)
+            output[y + 1, x - 1] += quant_error * (3 / 16)
+            output[y + 1, x] += quant_error * (5 / 16)
+            output[y + 1, x + 1] += quant_error * (1 / 16)
+    return output
+
+
+def test_floyd_steinberg_matches_loop():
+    channel = np.random.RandomState(0).randint(low=0, high=255, size=(64, 64), dtype=np.uint8)
+    interior = (slice(1, -1), slice(1, -1))
+    dithered = Dithering(dither="floyd")(channel)[interior]
+    expected = floyd_steinberg_loop(channel)[interior]
+
+    assert set(np.unique(dithered)) <= {0, 255}
+    # integer error shifts may flip a pixel where the float error sits right at the threshold
+    assert np.mean(dithered != expected) < 0.01
+
+
+def test_floyd_steinberg_colour_matches_channels(random_image):
+    dithered = Dithering(dither="floyd")(random_image)
+    for channel_num in range(random_image.shape[2]):
+        channel = np.ascontiguousarray(random_image[:, :, channel_num])
+        assert np.array_equal(dithered[:, :, channel_num], _fs_numba(channel))
+
+
+def dither_floyd_steinberg(image):
+    return Dithering(dither="floyd")(image).shape
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="requires the fork start method",
+)
+def test_floyd_steinberg_in_forked_process(random_image):
+    # use the channel thread pool in this process before forking
+    Dithering(dither="floyd")(random_image)
+
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        shape = pool.apply_async(dither_floyd_steinberg, (random_image,)).get(timeout=30)
+    assert shape == random_image.shape
+
+
+def test_apply_ordered_uses_given_matrix(random_image):
+    dithering = Dithering(dither="ordered", order=2)
+    ysize, xsize = random_image.shape[:2]
+    below = dithering.apply_Ordered(random_image, ysize, xsize, 2, np.zeros((4, 4), dtype=np.uint8))
+    above = dithering.apply_Ordered(random_image, ysize, xsize, 2, np.full((4, 4), 255, dtype=np.uint8))
+    assert np.array_equal(below, np.where(random_image > 0, 255, 0))
+    assert not above.any()
@@ -0,0 +1,30 @@
+import random
+
+import numpy as np
+import pytest
+
+from augraphy import *
+
+
+@pytest.fixture
+def random_image():
+    xdim = random.randint(51, 500)
+    ydim = random.randint(51, 500)
+    return np.random.randint(low=0, high=255, size=(xdim, ydim, 3), dtype=np.uint8)
+
+
+def test_geometric_crop(random_image):
+    augmented = Geometric(crop=(10, 20, 40, 50))(random_image)
+    assert augmented.shape == (30, 30, 3)
+
+
+def test_geometric_crop_to_image_size(random_image):
+    ysize, xsize = random_image.shape[:2]
+    augmented = Geometric(crop=(10, 20, -1, -1))(random_image)
+    assert augmented.shape == (ysize - 20, xsize - 10, 3)
+    assert np.array_equal(augmented, random_image[20:, 10:])
+
+
+def test_geometric_output_does_not_share_input(random_image):
+    for geometric in [Geometric(), Geometric(crop=(10, 20, 40, 50)), Geometric(scale=(1, 1))]:
+        assert not np.may_share_memory(geometric(random_image), random_image)
@@ -0,0 +1,33 @@
+import random
+
+import numpy as np
+import pytest
+
+from augraphy import *
+
+
+@pytest.fixture
+def random_image():
+    xdim = random.randint(51, 300)
+    ydim = random.randint(51, 300)
+    return np.random.randint(low=0, high=255, size=(xdim, ydim, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("mode", ["linear_static", "linear_dynamic", "gaussian"])
+def test_light_mask_not_constant(random_image, mode):
+    ysize, xsize = random_image.shape[:2]
+    lighting_gradient = LightingGradient(mode=mode)
+    mask = lighting_gradient.generate_parallel_light_mask(
+        mask_size=(xsize, ysize),
+        position=(xsize // 2, ysize // 2),
+        direction=0,
+        mode=mode,
+    )
+    assert mask.shape == (ysize, xsize)
+    assert mask.min() != mask.max()
+
+
+@pytest.mark.parametrize("mode", ["linear_static", "linear_dynamic", "gaussian"])
+def test_lighting_gradient(random_image, mode):
+    augmented = LightingGradient(mode=mode)(random_image)
+    assert augmented.shape == random_image.shape
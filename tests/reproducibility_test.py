@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from augraphy import *
+
+
+@pytest.fixture
+def random_image():
+    return np.random.randint(low=0, high=255, size=(200, 150, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize(
+    "augmentation",
+    [
+        Letterpress(p=1),
+        Jpeg(p=1),
+        Geometric(scale=(0.5, 1.5), rotate_range=(-30, 30), p=1),
+        SubtleNoise(p=1),
+    ],
+)
+def test_augmentation_follows_numpy_seed(random_image, augmentation):
+    np.random.seed(7)
+    first = augmentation(random_image)
+    np.random.seed(7)
+    second = augmentation(random_image)
+    assert np.array_equal(first, second)
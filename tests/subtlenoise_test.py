@@ -0,0 +1,25 @@
+import random
+
+import numpy as np
+import pytest
+
+from augraphy import *
+
+
+@pytest.fixture
+def random_image():
+    xdim = random.randint(51, 500)
+    ydim = random.randint(51, 500)
+    return np.random.randint(low=0, high=255, size=(xdim, ydim, 3), dtype=np.uint8)
+
+
+def test_subtle_noise_range(random_image):
+    augmented = SubtleNoise(subtle_range=10, p=1)(random_image)
+    difference = augmented.astype("int") - random_image
+    assert augmented.shape == random_image.shape
+    assert difference.min() >= -10 and difference.max() < 10
+
+
+def test_subtle_noise_single_channel_keeps_shape(random_image):
+    image = random_image[:, :, :1]
+    assert SubtleNoise(p=1)(image).shape == image.shape